@@ -2,31 +2,83 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional, Pattern, Tuple
 import logging
+import re
 
 class BaseDownloader(ABC):
+    # Display name used in progress output and as the routing key
+    PLATFORM: str = ""
+    # Precompiled URL patterns; each must capture the video ID as (?P<id>...)
+    URL_PATTERNS: Tuple[Pattern, ...] = ()
+    # Precompiled patterns for short links that must be resolved before use;
+    # the short code is captured as (?P<id>...) for when resolution fails
+    SHORT_URL_PATTERNS: Tuple[Pattern, ...] = ()
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        
-    @abstractmethod
+    
+    def match_url(self, url: str) -> Optional[re.Match]:
+        """Match the URL against the canonical (non-short) patterns."""
+        for pattern in self.URL_PATTERNS:
+            match = pattern.match(url)
+            if match:
+                return match
+        return None
+    
+    def video_id_from_match(self, match: re.Match) -> str:
+        """Build the canonical video ID from a successful pattern match."""
+        return match.group('id')
+    
+    def match_short_link(self, url: str) -> Optional[re.Match]:
+        """Match the URL against the short-link patterns."""
+        for pattern in self.SHORT_URL_PATTERNS:
+            match = pattern.match(url)
+            if match:
+                return match
+        return None
+    
+    def is_short_link(self, url: str) -> bool:
+        """Check if the URL is a short link that needs resolving."""
+        return self.match_short_link(url) is not None
+    
+    def resolve_short_link(self, url: str) -> Optional[str]:
+        """Follow a short link to its canonical URL, or None if it can't be resolved."""
+        return None
+    
+    def video_id_from_resolved_url(self, url: str) -> Optional[str]:
+        """Extract the video ID from the URL a short link redirected to."""
+        match = self.match_url(url)
+        return self.video_id_from_match(match) if match else None
+    
     def extract_video_id(self, url: str) -> str:
         """Extract the video ID from the platform-specific URL."""
-        pass
+        short_match = self.match_short_link(url)
+        if short_match:
+            resolved_url = self.resolve_short_link(url)
+            video_id = self.video_id_from_resolved_url(resolved_url) if resolved_url else None
+            # Unresolved links still get a stable, filename-safe ID
+            return video_id or short_match.group('id')
+        
+        match = self.match_url(url)
+        if not match:
+            raise ValueError(f"Invalid {self.PLATFORM} URL: {url}")
+        return self.video_id_from_match(match)
     
     @abstractmethod
-    def download(self, url: str, output_path: Path) -> Path:
+    def download(self, url: str, output_path: Path, video_id: Optional[str] = None) -> Path:
         """Download the video from the given URL.
         
         Args:
             url: The URL of the video to download
             output_path: Directory to save the downloaded video
+            video_id: Canonical video ID if already known (e.g. from a Route)
             
         Returns:
             Path to the downloaded video file
         """
         pass
     
-    @abstractmethod
     def is_valid_url(self, url: str) -> bool:
         """Check if the URL is valid for this platform."""
-        pass
\ No newline at end of file
+        return self.match_url(url) is not None or self.is_short_link(url)
\ No newline at end of file
@@ -2,10 +2,18 @@
 
 import re
 from pathlib import Path
+from typing import Optional
 from yt_dlp import YoutubeDL
 from .base_downloader import BaseDownloader
 
 class InstagramDownloader(BaseDownloader):
+    PLATFORM = "Instagram"
+    URL_PATTERNS = (
+        re.compile(r'^https?:\/\/(?:www\.)?instagram\.com\/(?:p|tv)\/(?P<id>[\w-]+)'),
+        re.compile(r'^https?:\/\/(?:www\.)?instagram\.com\/(?P<story>stories)\/[\w\.]+\/(?P<id>\d+)'),
+        re.compile(r'^https?:\/\/(?:www\.)?instagram\.com\/(?:[\w\.]+\/)?reel\/(?P<id>[\w-]+)\/?'),
+    )
+    
     def __init__(self):
         super().__init__()
         self.ydl_opts = {
@@ -20,33 +28,15 @@ class InstagramDownloader(BaseDownloader):
             }
         }
     
-    def is_valid_url(self, url: str) -> bool:
-        patterns = [
-            r'^https?:\/\/(?:www\.)?instagram\.com\/(?:p|tv)\/[\w-]+',
-            r'^https?:\/\/(?:www\.)?instagram\.com\/stories\/[\w\.]+\/\d+',
-            r'^https?:\/\/(?:www\.)?instagram\.com\/(?:[\w\.]+\/)?reel\/[\w-]+\/?'
-        ]
-        return any(re.match(pattern, url) for pattern in patterns)
-    
-    def extract_video_id(self, url: str) -> str:
-        if not self.is_valid_url(url):
-            raise ValueError(f"Invalid Instagram URL: {url}")
-            
-        # Extract the shortcode from the URL
-        match = re.search(r'(?:p|reel|tv)\/([a-zA-Z0-9_-]+)', url)
-        if match:
-            return match.group(1)
-            
-        # Handle stories differently
-        match = re.search(r'stories\/[\w\.]+\/(\d+)', url)
-        if match:
-            return f"story_{match.group(1)}"
-            
-        raise ValueError(f"Could not extract video ID from URL: {url}")
+    def video_id_from_match(self, match: re.Match) -> str:
+        # Stories use a numeric ID that would otherwise collide with shortcodes
+        if match.groupdict().get('story'):
+            return f"story_{match.group('id')}"
+        return match.group('id')
     
-    def download(self, url: str, output_path: Path) -> Path:
+    def download(self, url: str, output_path: Path, video_id: Optional[str] = None) -> Path:
         try:
-            video_id = self.extract_video_id(url)
+            video_id = video_id or self.extract_video_id(url)
             output_path = Path(output_path)
             output_path.mkdir(parents=True, exist_ok=True)
             
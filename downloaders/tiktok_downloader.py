@@ -1,13 +1,27 @@
 # src/downloaders/tiktok_downloader.py
 
 import re
+import requests
 from pathlib import Path
+from typing import Optional
 from yt_dlp import YoutubeDL
 from .base_downloader import BaseDownloader
+from src.utils.short_link_cache import ShortLinkCache
 
 class TikTokDownloader(BaseDownloader):
-    def __init__(self):
+    PLATFORM = "TikTok"
+    URL_PATTERNS = (
+        re.compile(r'^https?:\/\/(?:www\.)?tiktok\.com\/@[\w.-]+\/video\/(?P<id>\d+)'),
+    )
+    SHORT_URL_PATTERNS = (
+        re.compile(r'^https?:\/\/(?:vm|vt)\.tiktok\.com\/(?P<id>\w+)'),
+    )
+    # Redirects don't always land on the @user/video page (e.g. m.tiktok.com/v/<id>.html)
+    RESOLVED_ID_PATTERN = re.compile(r'\/(?:video|v)\/(?P<id>\d+)')
+    
+    def __init__(self, short_link_cache: Optional[ShortLinkCache] = None):
         super().__init__()
+        self.short_link_cache = short_link_cache if short_link_cache is not None else ShortLinkCache()
         self.ydl_opts = {
             'format': 'best',
             'quiet': True,
@@ -18,32 +32,47 @@ class TikTokDownloader(BaseDownloader):
             }
         }
     
-    def is_valid_url(self, url: str) -> bool:
-        patterns = [
-            r'^https?:\/\/(?:www\.)?tiktok\.com\/@[\w.-]+\/video\/\d+',
-            r'^https?:\/\/(?:vm|vt)\.tiktok\.com\/\w+',
-        ]
-        return any(re.match(pattern, url) for pattern in patterns)
+    def video_id_from_resolved_url(self, url: str) -> Optional[str]:
+        video_id = super().video_id_from_resolved_url(url)
+        if video_id:
+            return video_id
+        match = self.RESOLVED_ID_PATTERN.search(url)
+        return match.group('id') if match else None
     
-    def extract_video_id(self, url: str) -> str:
-        if not self.is_valid_url(url):
-            raise ValueError(f"Invalid TikTok URL: {url}")
-            
-        # Handle shortened URLs first
-        if 'vm.tiktok.com' in url or 'vt.tiktok.com' in url:
-            # We'll need to follow redirects to get the actual URL
-            # This will be implemented in the download method
-            return url
-            
-        match = re.search(r'video\/(\d+)', url)
-        if match:
-            return match.group(1)
-            
-        raise ValueError(f"Could not extract video ID from URL: {url}")
+    def resolve_short_link(self, url: str) -> Optional[str]:
+        """Follow a vm/vt.tiktok.com redirect, consulting the cache first.
+        
+        Returns None when the redirect can't be followed, leaving yt-dlp to
+        resolve the short link itself.
+        """
+        resolved_url = self.short_link_cache.get(url)
+        if resolved_url:
+            return resolved_url
+        
+        self.logger.info(f"Resolving TikTok short link: {url}")
+        try:
+            response = requests.head(
+                url,
+                allow_redirects=True,
+                headers=self.ydl_opts['headers'],
+                timeout=10
+            )
+        except requests.RequestException as e:
+            self.logger.warning(f"Could not resolve TikTok short link {url}: {e}")
+            return None
+        resolved_url = response.url
+        
+        # Only cache redirects that landed on a video page
+        if not self.video_id_from_resolved_url(resolved_url):
+            self.logger.warning(f"TikTok short link {url} redirected to a non-video page: {resolved_url}")
+            return None
+        
+        self.short_link_cache.put(url, resolved_url)
+        return resolved_url
     
-    def download(self, url: str, output_path: Path) -> Path:
+    def download(self, url: str, output_path: Path, video_id: Optional[str] = None) -> Path:
         try:
-            video_id = self.extract_video_id(url)
+            video_id = video_id or self.extract_video_id(url)
             output_path = Path(output_path)
             output_path.mkdir(parents=True, exist_ok=True)
             
@@ -0,0 +1,63 @@
+# src/downloaders/url_router.py
+
+from typing import List, NamedTuple, Optional, Pattern, Tuple
+from .base_downloader import BaseDownloader
+
+class Route(NamedTuple):
+    """Canonical identity of a video URL and the downloader that handles it."""
+    platform: str
+    video_id: str
+    downloader: BaseDownloader
+    # URL to hand to the downloader: the resolved page for short links when available
+    url: str
+    # False when a short link couldn't be resolved and video_id is only its short code
+    resolved: bool = True
+
+class URLRouter:
+    """Dispatches URLs to downloaders through a single precompiled pattern table."""
+    
+    def __init__(self, downloaders: List[BaseDownloader]):
+        self._routes: Tuple[Tuple[Pattern, BaseDownloader], ...] = tuple(
+            (pattern, downloader)
+            for downloader in downloaders
+            for pattern in downloader.URL_PATTERNS
+        )
+        self._short_routes: Tuple[Tuple[Pattern, BaseDownloader], ...] = tuple(
+            (pattern, downloader)
+            for downloader in downloaders
+            for pattern in downloader.SHORT_URL_PATTERNS
+        )
+    
+    def _match(self, url: str) -> Optional[Route]:
+        for pattern, downloader in self._routes:
+            match = pattern.match(url)
+            if match:
+                return Route(
+                    downloader.PLATFORM,
+                    downloader.video_id_from_match(match),
+                    downloader,
+                    url
+                )
+        return None
+    
+    def route(self, url: str) -> Optional[Route]:
+        """Return the canonical (platform, video ID) for a URL, or None if unsupported.
+        
+        Short links are resolved through the owning downloader, which caches
+        the redirect so repeat links don't hit the network. If resolution
+        fails the route keeps the raw short link and is marked unresolved.
+        """
+        route = self._match(url)
+        if route:
+            return route
+        
+        for pattern, downloader in self._short_routes:
+            match = pattern.match(url)
+            if not match:
+                continue
+            resolved_url = downloader.resolve_short_link(url)
+            video_id = downloader.video_id_from_resolved_url(resolved_url) if resolved_url else None
+            if video_id:
+                return Route(downloader.PLATFORM, video_id, downloader, resolved_url)
+            return Route(downloader.PLATFORM, match.group('id'), downloader, url, resolved=False)
+        return None
\ No newline at end of file
@@ -2,10 +2,18 @@
 
 import re
 from pathlib import Path
+from typing import Optional
 from yt_dlp import YoutubeDL
 from .base_downloader import BaseDownloader
 
 class YouTubeDownloader(BaseDownloader):
+    PLATFORM = "YouTube"
+    URL_PATTERNS = (
+        re.compile(r'^https?:\/\/(?:www\.)?youtube\.com\/watch\?v=(?P<id>[\w-]+)'),
+        re.compile(r'^https?:\/\/(?:www\.)?youtube\.com\/shorts\/(?P<id>[\w-]+)'),
+        re.compile(r'^https?:\/\/youtu\.be\/(?P<id>[\w-]+)'),
+    )
+    
     def __init__(self):
         super().__init__()
         self.ydl_opts = {
@@ -15,32 +23,8 @@ class YouTubeDownloader(BaseDownloader):
             'extract_flat': False,
         }
     
-    def is_valid_url(self, url: str) -> bool:
-        patterns = [
-            r'^https?:\/\/(?:www\.)?youtube\.com\/watch\?v=[\w-]+',
-            r'^https?:\/\/(?:www\.)?youtube\.com\/shorts\/[\w-]+',
-            r'^https?:\/\/youtu\.be\/[\w-]+'
-        ]
-        return any(re.match(pattern, url) for pattern in patterns)
-    
-    def extract_video_id(self, url: str) -> str:
-        if not self.is_valid_url(url):
-            raise ValueError(f"Invalid YouTube URL: {url}")
-            
-        patterns = [
-            r'(?:v=|\/)([\w-]{11})(?:\?|&|\/|$)',
-            r'(?:shorts\/)([\w-]{11})(?:\?|&|\/|$)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        raise ValueError(f"Could not extract video ID from URL: {url}")
-    
-    def download(self, url: str, output_path: Path) -> Path:
-        video_id = self.extract_video_id(url)
+    def download(self, url: str, output_path: Path, video_id: Optional[str] = None) -> Path:
+        video_id = video_id or self.extract_video_id(url)
         output_path = Path(output_path)
         output_path.mkdir(parents=True, exist_ok=True)
         
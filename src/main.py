@@ -14,6 +14,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeEl
 from downloaders.youtube_downloader import YouTubeDownloader
 from downloaders.tiktok_downloader import TikTokDownloader
 from downloaders.instagram_downloader import InstagramDownloader
+from downloaders.url_router import Route, URLRouter
 from src.processors.video_processor import VideoProcessor
 
 class VideoConverter:
@@ -27,6 +28,7 @@ class VideoConverter:
         self.youtube = YouTubeDownloader()
         self.tiktok = TikTokDownloader()
         self.instagram = InstagramDownloader()
+        self.router = URLRouter([self.youtube, self.tiktok, self.instagram])
         self.processor = VideoProcessor()
         
         # Set up logging
@@ -37,16 +39,9 @@ class VideoConverter:
         )
         self.logger = logging.getLogger("video_converter")
     
-    def _detect_platform(self, url: str) -> tuple[str, Optional[object]]:
-        """Determine which platform the URL is from and return appropriate downloader."""
-        if self.youtube.is_valid_url(url):
-            return "YouTube", self.youtube
-        elif self.tiktok.is_valid_url(url):
-            return "TikTok", self.tiktok
-        elif self.instagram.is_valid_url(url):
-            return "Instagram", self.instagram
-        else:
-            return "Unknown", None
+    def _detect_platform(self, url: str) -> Optional[Route]:
+        """Determine which platform the URL is from, its canonical video ID and downloader."""
+        return self.router.route(url)
     
     def _generate_output_filename(self, platform: str) -> Path:
         """Generate a unique output filename."""
@@ -59,8 +54,8 @@ class VideoConverter:
         """Main workflow to download and process a video from a given URL."""
         try:
             # Detect platform and get appropriate downloader
-            platform, downloader = self._detect_platform(url)
-            if not downloader:
+            route = self._detect_platform(url)
+            if route is None:
                 self.console.print(f"[red]Error: Unsupported URL format: {url}")
                 self.console.print("Supported platforms: YouTube, TikTok, Instagram")
                 return None
@@ -75,13 +70,17 @@ class VideoConverter:
             ) as progress:
                 # Step 1: Download the video
                 download_task = progress.add_task(
-                    f"[cyan]Downloading {platform} video...",
+                    f"[cyan]Downloading {route.platform} video...",
                     total=None
                 )
                 
                 downloads_dir = Path("downloads")
                 downloads_dir.mkdir(exist_ok=True)
-                downloaded_file = downloader.download(url, downloads_dir)
+                downloaded_file = route.downloader.download(
+                    route.url,
+                    downloads_dir,
+                    video_id=route.video_id
+                )
                 progress.update(download_task, completed=True)
                 
                 # Step 2: Process for WhatsApp
@@ -90,7 +89,7 @@ class VideoConverter:
                     total=None
                 )
                 
-                output_file = self._generate_output_filename(platform)
+                output_file = self._generate_output_filename(route.platform)
                 processed_file = self.processor.process_for_whatsapp(
                     downloaded_file,
                     output_file,
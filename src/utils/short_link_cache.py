@@ -0,0 +1,73 @@
+# src/utils/short_link_cache.py
+
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+class ShortLinkCache:
+    """Bounded, file-backed LRU cache of short-link redirect resolutions."""
+
+    DEFAULT_PATH = Path.home() / ".cache" / "the-joke-expediter" / "short_links.json"
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(self, cache_file: Optional[Path] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.logger = logging.getLogger(__name__)
+        self.cache_file = Path(cache_file) if cache_file else self.DEFAULT_PATH
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._load()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """Normalise a short link so trivial variations share one entry."""
+        url = url.split('#', 1)[0].split('?', 1)[0].rstrip('/')
+        return url.replace('http://', 'https://', 1)
+
+    def _load(self) -> None:
+        """Read previously resolved links from disk, ignoring a corrupt file."""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            for short_url, resolved_url in list(data.items())[-self.max_entries:]:
+                self._entries[short_url] = resolved_url
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable short-link cache {self.cache_file}: {e}")
+            self._entries.clear()
+
+    def _save(self) -> None:
+        """Write the cache atomically so an interrupted run can't corrupt it."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix('.tmp')
+            with open(temp_file, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to save short-link cache: {e}")
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the cached resolution for a short link, if any."""
+        key = self._key(url)
+        resolved_url = self._entries.get(key)
+        # Persist the new recency so eviction stays LRU across runs
+        if resolved_url is not None and next(reversed(self._entries)) != key:
+            self._entries.move_to_end(key)
+            self._save()
+        return resolved_url
+
+    def put(self, url: str, resolved_url: str) -> None:
+        """Record a resolution, evicting the least recently used entries."""
+        key = self._key(url)
+        self._entries[key] = resolved_url
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,85 @@
+# tests/unit/test_short_link_cache.py
+
+import json
+
+import pytest
+
+from src.utils import short_link_cache
+from src.utils.short_link_cache import ShortLinkCache
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return tmp_path / "short_links.json"
+
+@pytest.mark.parametrize("variant", [
+    "https://vm.tiktok.com/ZMabc",
+    "https://vm.tiktok.com/ZMabc/",
+    "http://vm.tiktok.com/ZMabc",
+    "https://vm.tiktok.com/ZMabc?_r=1",
+    "https://vm.tiktok.com/ZMabc/#share",
+])
+def test_key_normalisation(cache_file, variant):
+    cache = ShortLinkCache(cache_file)
+    cache.put("https://vm.tiktok.com/ZMabc", "resolved")
+    assert cache.get(variant) == "resolved"
+    assert len(cache) == 1
+
+def test_short_code_is_case_sensitive(cache_file):
+    cache = ShortLinkCache(cache_file)
+    cache.put("https://vm.tiktok.com/ZMabc", "resolved")
+    assert cache.get("https://vm.tiktok.com/zmabc") is None
+
+def test_evicts_least_recently_used(cache_file):
+    cache = ShortLinkCache(cache_file, max_entries=2)
+    cache.put("https://a", "1")
+    cache.put("https://b", "2")
+    cache.get("https://a")
+    cache.put("https://c", "3")
+    assert cache.get("https://a") == "1"
+    assert cache.get("https://b") is None
+    assert cache.get("https://c") == "3"
+
+def test_hit_order_persists_across_runs(cache_file):
+    cache = ShortLinkCache(cache_file, max_entries=2)
+    cache.put("https://a", "1")
+    cache.put("https://b", "2")
+    ShortLinkCache(cache_file, max_entries=2).get("https://a")
+    
+    cache = ShortLinkCache(cache_file, max_entries=2)
+    cache.put("https://c", "3")
+    assert cache.get("https://a") == "1"
+    assert cache.get("https://b") is None
+
+def test_reload_from_disk(cache_file):
+    ShortLinkCache(cache_file).put("https://vm.tiktok.com/ZMabc", "resolved")
+    assert ShortLinkCache(cache_file).get("https://vm.tiktok.com/ZMabc") == "resolved"
+
+def test_reload_truncates_to_most_recent(cache_file):
+    cache = ShortLinkCache(cache_file)
+    for i in range(5):
+        cache.put(f"https://{i}", str(i))
+    
+    cache = ShortLinkCache(cache_file, max_entries=2)
+    assert len(cache) == 2
+    assert cache.get("https://3") == "3"
+    assert cache.get("https://4") == "4"
+    assert cache.get("https://2") is None
+
+def test_corrupt_file_is_ignored(cache_file):
+    cache_file.write_text("{not json")
+    cache = ShortLinkCache(cache_file)
+    assert len(cache) == 0
+    cache.put("https://a", "1")
+    assert json.loads(cache_file.read_text()) == {"https://a": "1"}
+
+def test_save_is_atomic(cache_file, monkeypatch):
+    cache = ShortLinkCache(cache_file)
+    cache.put("https://a", "1")
+    assert not cache_file.with_suffix(".tmp").exists()
+    
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(short_link_cache.os, "replace", fail_replace)
+    cache.put("https://b", "2")
+    
+    assert json.loads(cache_file.read_text()) == {"https://a": "1"}
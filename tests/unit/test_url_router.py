@@ -0,0 +1,95 @@
+# tests/unit/test_url_router.py
+
+import types
+
+import pytest
+import requests
+
+from downloaders.instagram_downloader import InstagramDownloader
+from downloaders.tiktok_downloader import TikTokDownloader
+from downloaders.url_router import URLRouter
+from downloaders.youtube_downloader import YouTubeDownloader
+from src.utils.short_link_cache import ShortLinkCache
+
+SHORT_URL = "https://vm.tiktok.com/ZMabc123/"
+
+class FakeHead:
+    """Stand-in for requests.head that records calls and redirects to ``target``."""
+    
+    def __init__(self):
+        self.urls = []
+        self.target = "https://www.tiktok.com/@user/video/7123456789?_r=1"
+    
+    def __call__(self, url, **kwargs):
+        self.urls.append(url)
+        if isinstance(self.target, Exception):
+            raise self.target
+        return types.SimpleNamespace(url=self.target)
+
+@pytest.fixture(autouse=True)
+def head_calls(monkeypatch):
+    fake_head = FakeHead()
+    monkeypatch.setattr(requests, "head", fake_head)
+    return fake_head
+
+@pytest.fixture
+def tiktok(tmp_path):
+    return TikTokDownloader(ShortLinkCache(tmp_path / "short_links.json"))
+
+@pytest.fixture
+def router(tiktok):
+    return URLRouter([YouTubeDownloader(), tiktok, InstagramDownloader()])
+
+@pytest.mark.parametrize("url, platform, video_id", [
+    ("https://www.youtube.com/watch?v=dXLCHvRsgRQ&t=10", "YouTube", "dXLCHvRsgRQ"),
+    ("https://youtu.be/dXLCHvRsgRQ", "YouTube", "dXLCHvRsgRQ"),
+    ("https://www.youtube.com/shorts/abcdefghijk", "YouTube", "abcdefghijk"),
+    ("https://www.tiktok.com/@some.user/video/7123456789", "TikTok", "7123456789"),
+    ("https://www.instagram.com/p/ABC123/", "Instagram", "ABC123"),
+    ("https://www.instagram.com/some.user/reel/Cz1-x_/", "Instagram", "Cz1-x_"),
+    ("https://www.instagram.com/stories/some.user/3141592653", "Instagram", "story_3141592653"),
+])
+def test_routes_canonical_urls(router, url, platform, video_id):
+    route = router.route(url)
+    assert (route.platform, route.video_id, route.url, route.resolved) == (platform, video_id, url, True)
+
+def test_unsupported_url(router):
+    assert router.route("https://example.com/video/123") is None
+
+def test_short_link_resolves_to_numeric_id(router, head_calls):
+    route = router.route(SHORT_URL)
+    assert route.platform == "TikTok"
+    assert route.video_id == "7123456789"
+    assert route.url == head_calls.target
+    assert route.resolved
+
+def test_short_link_cached_across_instances(tmp_path, head_calls):
+    cache_file = tmp_path / "short_links.json"
+    URLRouter([TikTokDownloader(ShortLinkCache(cache_file))]).route(SHORT_URL)
+    
+    router = URLRouter([TikTokDownloader(ShortLinkCache(cache_file))])
+    route = router.route("http://vm.tiktok.com/ZMabc123?_r=1")
+    assert route.video_id == "7123456789"
+    assert head_calls.urls == [SHORT_URL]
+
+def test_short_link_mobile_redirect(router, head_calls):
+    head_calls.target = "https://m.tiktok.com/v/7123456789.html"
+    assert router.route(SHORT_URL).video_id == "7123456789"
+
+@pytest.mark.parametrize("target", [
+    requests.ConnectionError("offline"),
+    "https://www.tiktok.com/login",
+])
+def test_unresolved_short_link_falls_back(router, tiktok, head_calls, target):
+    head_calls.target = target
+    route = router.route(SHORT_URL)
+    assert route.platform == "TikTok"
+    assert route.video_id == "ZMabc123"
+    assert route.url == SHORT_URL
+    assert not route.resolved
+    assert len(tiktok.short_link_cache) == 0
+
+def test_extract_video_id_matches_route(tiktok, head_calls):
+    assert tiktok.extract_video_id(SHORT_URL) == "7123456789"
+    head_calls.target = requests.Timeout("slow")
+    assert tiktok.extract_video_id("https://vt.tiktok.com/ZMother") == "ZMother"